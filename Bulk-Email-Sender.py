@@ -13,6 +13,8 @@ Features
 
 How to run
 1) pip install PyQt5
+   (optional) pip install orjson  -- faster loading/saving of large email lists
+   (optional) pip install aiosmtplib  -- asyncio-based sending (enable on SMTP Config)
 2) python app.py 
 
 Optional external import
@@ -32,16 +34,37 @@ Security note
 """
 
 import os
+import re
+import asyncio
 import sys
 import json
+import mmap
+from io import BytesIO
 import ssl
+import base64
 import smtplib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
-
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject
+from email.generator import BytesGenerator
+from email.charset import Charset, QP
+import email.policy
+
+try:
+    import orjson  # optional, much faster for large email lists
+except ImportError:
+    orjson = None
+
+try:
+    import aiosmtplib  # optional, asyncio SMTP backend for sending
+except ImportError:
+    aiosmtplib = None
+
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog,
     QHBoxLayout, QVBoxLayout,
@@ -63,13 +86,92 @@ APP_DIR = os.path.abspath(os.path.dirname(__file__))
 CONFIG_PATH = resource_path("config.json")
 EMAILS_PATH = resource_path("emails.json")
 DRAFT_PATH = resource_path("draft.json")
+EMAILS_COUNT_PATH = EMAILS_PATH + ".count"
+
+# Attachment read size; a multiple of 57 so base64 lines stay aligned.
+ATTACHMENT_CHUNK_SIZE = 57 * 1000
+
+# Encoded attachments are reused across campaigns while the file is
+# unchanged, keyed by (path, mtime_ns, size) and evicted LRU past this size.
+ATTACHMENT_CACHE_LIMIT = 256 * 1024 * 1024
+_ATT_CACHE = OrderedDict()
+_ATT_CACHE_LOCK = threading.Lock()
+
+# SMTP transparency (RFC 5321 4.5.2): lines starting with "." get doubled.
+_LEADING_DOT_RE = re.compile(rb"(?m)^\.")
+
+# Message bodies are declared utf-8 up front; quoted-printable keeps mostly
+# ASCII text readable on the wire instead of base64.
+_BODY_CHARSET = Charset("utf-8")
+_BODY_CHARSET.body_encoding = QP
+
+# Send log batching: flush after this many lines or this many milliseconds.
+LOG_BATCH_SIZE = 100
+LOG_BATCH_MS = 50
+
+# Upper bound on parallel SMTP connections, for the spin box and imported configs.
+MAX_PARALLEL = 100
+
+# Idle SMTP sessions get a NOOP this often so the next campaign can reuse them.
+SMTP_KEEPALIVE_MS = 30 * 1000
+
+# Socket timeout for SMTP sessions, so a half-open pooled session fails its
+# NOOP instead of stalling the campaign until TCP gives up.
+SMTP_TIMEOUT = 30
+
+# Lists longer than this are kept in memory and only previewed in the editor.
+EMAIL_PREVIEW_LIMIT = 5000
+
+# Cheap shape check for recipients: something@domain.tld, no spaces.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# "12. user@example.com" -> "user@example.com" on the Email List page.
+_NUM_PREFIX_RE = re.compile(r"^\d+\s*\.\s*")
 
 # -------------------------- Utility: Config Manager -------------------------- #
 class ConfigManager:
+    _writer_pool = None
+    _notifier = None
+    _next_ticket = 0
+
+    @staticmethod
+    def writer_pool():
+        # A single writer thread keeps saves of the same file in order.
+        if ConfigManager._writer_pool is None:
+            pool = QThreadPool()
+            pool.setMaxThreadCount(1)
+            ConfigManager._writer_pool = pool
+        return ConfigManager._writer_pool
+
+    @staticmethod
+    def notifier():
+        if ConfigManager._notifier is None:
+            ConfigManager._notifier = SaveNotifier()
+        return ConfigManager._notifier
+
+    @staticmethod
+    def save_json_async(path, data, after=None):
+        """ Queue a background save; returns the ticket notifier().done reports """
+        ConfigManager._next_ticket += 1
+        ticket = ConfigManager._next_ticket
+        ConfigManager.notifier()  # created here, on the GUI thread
+        ConfigManager.writer_pool().start(JsonWriter(ticket, path, data, after))
+        return ticket
+
+    @staticmethod
+    def flush():
+        """ Block until all queued background saves are on disk """
+        if ConfigManager._writer_pool is not None:
+            ConfigManager._writer_pool.waitForDone()
+
     @staticmethod
     def load_json(path, default):
+        ConfigManager.flush()
         try:
             if os.path.exists(path):
+                if orjson is not None:
+                    with open(path, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(path, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except Exception:
@@ -78,8 +180,20 @@ class ConfigManager:
 
     @staticmethod
     def save_json(path, data):
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated file that load_json would silently discard.
+        tmp = path + ".tmp"
+        if orjson is not None:
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
 
     @staticmethod
     def load_smtp():
@@ -89,33 +203,64 @@ class ConfigManager:
             "use_tls": True,
             "use_ssl": False,
             "username": "",
-            "password": ""
+            "password": "",
+            "parallel": 1,
+            "use_asyncio": False
         })
 
+    @staticmethod
+    def smtp_parallel(cfg):
+        # "parallel" can come from an imported file, so anything odd means 1
+        try:
+            return max(1, min(int(cfg.get("parallel", 1)), MAX_PARALLEL))
+        except (TypeError, ValueError):
+            return 1
+
     @staticmethod
     def save_smtp(cfg):
-        ConfigManager.save_json(CONFIG_PATH, cfg)
+        return ConfigManager.save_json_async(CONFIG_PATH, cfg)
 
     @staticmethod
     def load_emails():
         data = ConfigManager.load_json(EMAILS_PATH, {"recipients": []})
-        uniq, seen = [], set()
-        for e in data.get("recipients", []):
-            e2 = e.strip()
-            if e2 and e2 not in seen:
-                uniq.append(e2)
-                seen.add(e2)
+        uniq = list(dict.fromkeys(e for e in map(str.strip, data.get("recipients", [])) if e))
         return {"recipients": uniq}
 
     @staticmethod
     def save_emails(lst):
-        uniq, seen = [], set()
-        for e in lst:
-            e2 = e.strip()
-            if e2 and e2 not in seen:
-                uniq.append(e2)
-                seen.add(e2)
-        ConfigManager.save_json(EMAILS_PATH, {"recipients": uniq})
+        uniq = list(dict.fromkeys(e for e in map(str.strip, lst) if e))
+        count = len(uniq)
+        # The sidecar is only written once the list itself is on disk, so a
+        # failed save never leaves a count that is newer than emails.json.
+        return ConfigManager.save_json_async(
+            EMAILS_PATH, {"recipients": uniq},
+            after=lambda: ConfigManager.save_email_count(count)
+        )
+
+    @staticmethod
+    def save_email_count(n):
+        # Sidecar so the recipient count can be shown without parsing the list
+        try:
+            tmp = EMAILS_COUNT_PATH + ".tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(str(n))
+            os.replace(tmp, EMAILS_COUNT_PATH)
+        except Exception:
+            # A missing or older sidecar just makes load_email_count fall back
+            pass
+
+    @staticmethod
+    def load_email_count():
+        # Only trusted when written no earlier than emails.json itself;
+        # returns None when the list has to be loaded to count it.
+        ConfigManager.flush()
+        try:
+            if os.path.getmtime(EMAILS_COUNT_PATH) >= os.path.getmtime(EMAILS_PATH):
+                with open(EMAILS_COUNT_PATH, 'r', encoding='utf-8') as f:
+                    return int(f.read(32))
+        except (OSError, ValueError):
+            pass
+        return None
 
     @staticmethod
     def load_draft():
@@ -133,7 +278,119 @@ class ConfigManager:
             "body": draft.get("body", ""),
             "attachments": atts
         }
-        ConfigManager.save_json(DRAFT_PATH, draft)
+        return ConfigManager.save_json_async(DRAFT_PATH, draft)
+
+
+class SaveNotifier(QObject):
+    """ Reports background save results back to the GUI thread """
+    done = pyqtSignal(int, str, str)  # ticket, path, error ("" on success)
+
+
+class JsonWriter(QRunnable):
+    """ Saves one JSON file on the ConfigManager writer thread """
+
+    def __init__(self, ticket, path, data, after=None):
+        super().__init__()
+        self.ticket = ticket
+        self.path = path
+        self.data = data
+        self.after = after  # runs only if the save succeeded
+
+    def run(self):
+        error = ""
+        try:
+            ConfigManager.save_json(self.path, self.data)
+            if self.after is not None:
+                self.after()
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        ConfigManager.notifier().done.emit(self.ticket, self.path, error)
+
+
+# ----------------------------- SMTP Session Pool ----------------------------- #
+class SmtpPool:
+    """ Logged-in smtplib sessions kept open between campaigns """
+
+    def __init__(self):
+        self._idle = []
+        self._key = None
+        self._limit = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cfg_key(cfg):
+        return tuple(sorted(cfg.items()))
+
+    @staticmethod
+    def _alive(server):
+        try:
+            return server.noop()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(server):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def take(self, cfg):
+        # An idle session for these settings that still answers NOOP, or None
+        while True:
+            with self._lock:
+                if self._key != self._cfg_key(cfg) or not self._idle:
+                    return None
+                server = self._idle.pop()
+            if self._alive(server):
+                return server
+            server.close()
+
+    def put(self, cfg, servers, limit):
+        stale, key = [], self._cfg_key(cfg)
+        with self._lock:
+            if self._key != key:
+                stale, self._idle, self._key = self._idle, [], key
+            self._limit = limit
+            self._idle.extend(servers)
+            stale.extend(self._idle[limit:])
+            del self._idle[limit:]
+        for server in stale:
+            self._quit(server)
+
+    def keepalive(self):
+        # Sessions are out of the pool while being NOOPed; settings may change
+        # or a campaign may return its own sessions in the meantime.
+        with self._lock:
+            servers, self._idle, key = self._idle, [], self._key
+        if not servers:
+            return
+        alive = []
+        for server in servers:
+            if self._alive(server):
+                alive.append(server)
+            else:
+                server.close()
+        stale = []
+        with self._lock:
+            if self._key != key:
+                stale = alive
+            else:
+                self._idle.extend(alive)
+                stale = self._idle[self._limit:]
+                del self._idle[self._limit:]
+        for server in stale:
+            self._quit(server)
+
+    def close_all(self, quit=True):
+        # quit=False just drops the sockets, for when nobody can wait on QUIT
+        with self._lock:
+            servers, self._idle = self._idle, []
+        for server in servers:
+            if quit:
+                self._quit(server)
+            else:
+                server.close()
 
 
 # ----------------------------- Email Sender Worker --------------------------- #
@@ -142,37 +399,177 @@ class SendWorker(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, smtp_cfg, recipients, subject, body, attachments):
+    def __init__(self, smtp_cfg, recipients, subject, body, attachments, pool=None):
         super().__init__()
         self.smtp_cfg = smtp_cfg
+        self.pool = pool
         self.recipients = recipients
         self.subject = subject
         self.body = body
         self.attachments = attachments
-        self._stop = False
+        self._stop = threading.Event()
+        self._log_buf = []
+        self._log_lock = threading.Lock()
 
     def stop(self):
-        self._stop = True
+        self._stop.set()
+
+    def _log(self, text):
+        # Progress lines are batched so the log widget re-lays out a few
+        # times a second instead of once per recipient. Full batches go out
+        # here; _flush_log_every pushes out the rest on a timer.
+        with self._log_lock:
+            self._log_buf.append(text)
+            if len(self._log_buf) >= LOG_BATCH_SIZE:
+                self._emit_log()
+
+    def _flush_log_every(self, done):
+        while not done.wait(LOG_BATCH_MS / 1000):
+            self._flush_log()
+
+    def _flush_log(self):
+        with self._log_lock:
+            self._emit_log()
+
+    def _emit_log(self):
+        # Caller holds _log_lock, which keeps batches from different pool
+        # threads in order.
+        if self._log_buf:
+            self.progress.emit("\n".join(self._log_buf))
+            self._log_buf = []
 
-    def _build_message(self, sender, recipient):
-        msg = MIMEMultipart()
+    @staticmethod
+    def _encode_attachment(path):
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        with _ATT_CACHE_LOCK:
+            if key in _ATT_CACHE:
+                _ATT_CACHE.move_to_end(key)
+                return _ATT_CACHE[key]
+
+        # Chunks are a multiple of 57 bytes so every read encodes to whole
+        # 76-column base64 lines and the raw file never sits in memory.
+        encoded = bytearray()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(ATTACHMENT_CHUNK_SIZE), b""):
+                encoded += base64.encodebytes(chunk)
+        encoded = encoded.decode("ascii")
+
+        if len(encoded) <= ATTACHMENT_CACHE_LIMIT:
+            with _ATT_CACHE_LOCK:
+                for stale in [k for k in _ATT_CACHE if k[0] == key[0]]:
+                    del _ATT_CACHE[stale]
+                _ATT_CACHE[key] = encoded
+                cached = sum(map(len, _ATT_CACHE.values()))
+                while cached > ATTACHMENT_CACHE_LIMIT:
+                    _, evicted = _ATT_CACHE.popitem(last=False)
+                    cached -= len(evicted)
+        return encoded
+
+    def _build_template(self, sender):
+        # Attachments are read and encoded once per campaign; only the To
+        # header changes between recipients.
+        msg = MIMEMultipart(policy=email.policy.SMTP)
         msg["From"] = sender
-        msg["To"] = recipient
+        msg["To"] = ""
         msg["Subject"] = self.subject
-        msg.attach(MIMEText(self.body, 'plain'))
+        msg.attach(MIMEText(self.body, 'plain', _BODY_CHARSET, policy=email.policy.SMTP))
         for file in self.attachments:
             try:
-                with open(file, 'rb') as f:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(f.read())
-                encoders.encode_base64(part)
-                part.add_header('Content-Disposition', f'attachment; filename="{os.path.basename(file)}"')
+                part = MIMEBase('application', 'octet-stream', policy=email.policy.SMTP)
+                part.set_payload(self._encode_attachment(file))
+                part['Content-Transfer-Encoding'] = 'base64'
+                part.add_header('Content-Disposition', 'attachment', filename=os.path.basename(file))
                 msg.attach(part)
             except Exception as e:
-                self.progress.emit(f"Attachment error: {file} ({e}) — skipping this file.")
+                self._log(f"Attachment error: {file} ({e}) — skipping this file.")
         return msg
 
-    def run(self):
+    def _render_template(self, sender):
+        # Serialize the template once and split it around the To value, so
+        # each recipient's message is a plain bytes concatenation and the
+        # generator never runs inside the send loop.
+        buf = BytesIO()
+        BytesGenerator(buf, mangle_from_=False, policy=email.policy.SMTP).flatten(self._build_template(sender))
+        raw = buf.getvalue()
+        start = raw.index(b"\r\nTo:") + len(b"\r\nTo:")
+        end = raw.index(b"\r\n", start)
+        return raw[:start] + b" ", raw[end:]
+
+    @staticmethod
+    def _send_pipelined(server, sender, recipient, data):
+        # RFC 2920: MAIL, RCPT and DATA are written in one go and their
+        # replies read afterwards, so each message costs two round-trips
+        # instead of four. ``data`` is already dot-stuffed and ends with
+        # the terminating "." line.
+        server.send(
+            f"MAIL FROM:{smtplib.quoteaddr(sender)}\r\n"
+            f"RCPT TO:{smtplib.quoteaddr(recipient)}\r\n"
+            "DATA\r\n"
+        )
+        mail_code, mail_resp = server.getreply()
+        rcpt_code, rcpt_resp = server.getreply()
+        data_code, data_resp = server.getreply()
+        if data_code == 354:
+            if mail_code == 250 and rcpt_code in (250, 251):
+                server.send(data)
+            else:
+                server.send(b".\r\n")
+            data_code, data_resp = server.getreply()
+
+        if mail_code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, sender)
+        if rcpt_code not in (250, 251):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused({recipient: (rcpt_code, rcpt_resp)})
+        if data_code != 250:
+            server.rset()
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+    def _connect(self):
+        host = self.smtp_cfg.get("smtp_host", "")
+        port = int(self.smtp_cfg.get("smtp_port", 587))
+        use_tls = bool(self.smtp_cfg.get("use_tls", True))
+        use_ssl = bool(self.smtp_cfg.get("use_ssl", False))
+        username = self.smtp_cfg.get("username", "")
+        password = self.smtp_cfg.get("password", "")
+
+        context = ssl.create_default_context()
+        if use_ssl:
+            server = smtplib.SMTP_SSL(host, port, context=context, timeout=SMTP_TIMEOUT)
+        else:
+            server = smtplib.SMTP(host, port, timeout=SMTP_TIMEOUT)
+        try:
+            server.ehlo()
+            if use_tls and not use_ssl:
+                server.starttls(context=context)
+                server.ehlo()
+            if username:
+                self._login(server, username, password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    @staticmethod
+    def _login(server, username, password):
+        # AUTH PLAIN with an initial response (RFC 4616) logs in with a single
+        # command; smtplib.login() tries CRAM-MD5 first, which takes two.
+        if "plain" in server.esmtp_features.get("auth", "").lower().split():
+            token = base64.b64encode(f"\0{username}\0{password}".encode("utf-8")).decode("ascii")
+            code, resp = server.docmd("AUTH", "PLAIN " + token)
+            if code == 235:
+                return
+            if code == 535:
+                raise smtplib.SMTPAuthenticationError(code, resp)
+            if code == 334:
+                # Server ignored the initial response and wants SASL data;
+                # cancel the exchange (RFC 4954) before falling back.
+                server.docmd("*")
+        server.login(username, password)
+
+    async def _connect_async(self):
         host = self.smtp_cfg.get("smtp_host", "")
         port = int(self.smtp_cfg.get("smtp_port", 587))
         use_tls = bool(self.smtp_cfg.get("use_tls", True))
@@ -180,40 +577,194 @@ class SendWorker(QObject):
         username = self.smtp_cfg.get("username", "")
         password = self.smtp_cfg.get("password", "")
 
+        client = aiosmtplib.SMTP(
+            hostname=host, port=port,
+            use_tls=use_ssl, start_tls=use_tls and not use_ssl,
+            tls_context=ssl.create_default_context()
+        )
+        await client.connect()
+        try:
+            if username:
+                await client.login(username, password)
+        except Exception:
+            client.close()
+            raise
+        return client
+
+    def _send_threaded(self, recipients, head, tail, parallel):
+        username = self.smtp_cfg.get("username", "")
+        total = len(recipients)
+        pending = deque(enumerate(recipients, start=1))
+        servers = []
+        connect_errors = []
+        lock = threading.Lock()
+
+        # DATA payload for the pipelined path, dot-stuffed once per campaign.
+        # The address is spliced in mid-line, so it never changes which
+        # lines need stuffing.
+        data_head = _LEADING_DOT_RE.sub(b"..", head)
+        data_tail = _LEADING_DOT_RE.sub(b"..", tail)
+        if not data_tail.endswith(b"\r\n"):
+            data_tail += b"\r\n"
+        data_tail += b".\r\n"
+
+        def open_session():
+            server = self.pool.take(self.smtp_cfg) if self.pool is not None else None
+            return server if server is not None else self._connect()
+
+        def drain():
+            # One SMTP session per pool thread, pulling recipients from the
+            # shared queue. A thread whose session cannot be opened, or is
+            # dropped by the server, leaves the rest to the other sessions.
+            try:
+                server = open_session()
+            except Exception as e:
+                with lock:
+                    connect_errors.append(e)
+                return
+            with lock:
+                servers.append(server)
+            while not self._stop.is_set():
+                try:
+                    idx, rcpt = pending.popleft()
+                except IndexError:
+                    return
+                try:
+                    addr = rcpt.encode("ascii")
+                    if server.has_extn("pipelining"):
+                        self._send_pipelined(server, username, rcpt, data_head + addr + data_tail)
+                    else:
+                        server.sendmail(username, [rcpt], head + addr + tail)
+                    self._log(f"[{idx}/{total}] Sent to {rcpt}")
+                except smtplib.SMTPServerDisconnected as e:
+                    self._log(f"[{idx}/{total}] Failed to {rcpt}: {e}")
+                    with lock:
+                        servers.remove(server)
+                    server.close()
+                    return
+                except Exception as e:
+                    self._log(f"[{idx}/{total}] Failed to {rcpt}: {e}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                for _ in range(parallel):
+                    pool.submit(drain)
+        finally:
+            if self.pool is not None:
+                self.pool.put(self.smtp_cfg, servers, parallel)
+            else:
+                for server in servers:
+                    SmtpPool._quit(server)
+
+        if connect_errors and len(connect_errors) < parallel:
+            self._log(
+                f"Could not open {len(connect_errors)} of {parallel} SMTP connections "
+                f"({connect_errors[0]}); sent over the remaining ones."
+            )
+        self._skip_unsent(pending, total)
+        if len(connect_errors) == parallel:
+            raise connect_errors[0]
+
+    def _skip_unsent(self, pending, total):
+        for idx, rcpt in pending:
+            self._log(f"[{idx}/{total}] Skipped {rcpt}: not sent")
+
+    async def _send_async(self, recipients, head, tail, parallel):
+        # aiosmtplib backend: one coroutine per connection draining a shared
+        # queue, all on this thread's event loop. An SMTP session runs one
+        # transaction at a time, so concurrency comes from the connections.
+        username = self.smtp_cfg.get("username", "")
+        total = len(recipients)
+        queue = asyncio.Queue()
+        for item in enumerate(recipients, start=1):
+            queue.put_nowait(item)
+
+        results = await asyncio.gather(
+            *(self._connect_async() for _ in range(parallel)), return_exceptions=True
+        )
+        clients = [r for r in results if not isinstance(r, BaseException)]
+        connect_errors = [r for r in results if isinstance(r, BaseException)]
+
+        async def drain(client):
+            while not self._stop.is_set():
+                try:
+                    idx, rcpt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await client.sendmail(username, [rcpt], head + rcpt.encode("ascii") + tail)
+                    self._log(f"[{idx}/{total}] Sent to {rcpt}")
+                except aiosmtplib.SMTPServerDisconnected as e:
+                    # Leave the rest of the queue to the live connections
+                    self._log(f"[{idx}/{total}] Failed to {rcpt}: {e}")
+                    live.remove(client)
+                    client.close()
+                    return
+                except Exception as e:
+                    self._log(f"[{idx}/{total}] Failed to {rcpt}: {e}")
+
+        live = list(clients)
+        try:
+            await asyncio.gather(*(drain(c) for c in clients))
+        finally:
+            for client in live:
+                try:
+                    await client.quit()
+                except Exception:
+                    client.close()
+
+        if connect_errors and clients:
+            self._log(
+                f"Could not open {len(connect_errors)} of {parallel} SMTP connections "
+                f"({connect_errors[0]}); sent over the remaining ones."
+            )
+        pending = []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        self._skip_unsent(pending, total)
+        if not clients:
+            raise connect_errors[0]
+
+    def run(self):
+        host = self.smtp_cfg.get("smtp_host", "")
+        username = self.smtp_cfg.get("username", "")
+        password = self.smtp_cfg.get("password", "")
+
         if not host or not username or not password:
             self.error.emit("SMTP settings incomplete. Please configure SMTP.")
             self.finished.emit()
             return
 
-        context = ssl.create_default_context()
-
+        # Malformed addresses are dropped here rather than costing an SMTP
+        # round-trip each just to be rejected by the server.
+        valid, invalid = [], []
+        for rcpt in self.recipients:
+            (valid if _EMAIL_RE.match(rcpt) else invalid).append(rcpt)
+        if invalid:
+            for rcpt in invalid:
+                self._log(f"Skipped {rcpt}: not a valid email address")
+            self._log(f"Filtered {len(invalid)} invalid addresses")
+
+        log_done = threading.Event()
+        threading.Thread(target=self._flush_log_every, args=(log_done,), daemon=True).start()
         try:
-            if use_ssl:
-                server = smtplib.SMTP_SSL(host, port, context=context)
-            else:
-                server = smtplib.SMTP(host, port)
-            with server:
-                server.ehlo()
-                if use_tls and not use_ssl:
-                    server.starttls(context=context)
-                    server.ehlo()
-                if username:
-                    server.login(username, password)
-
-                total = len(self.recipients)
-                for idx, rcpt in enumerate(self.recipients, start=1):
-                    if self._stop:
-                        self.progress.emit("Sending cancelled by user.")
-                        break
-                    try:
-                        msg = self._build_message(username, rcpt)
-                        server.sendmail(username, [rcpt], msg.as_string())
-                        self.progress.emit(f"[{idx}/{total}] Sent to {rcpt}")
-                    except Exception as e:
-                        self.progress.emit(f"[{idx}/{total}] Failed to {rcpt}: {e}")
+            parallel = max(1, min(ConfigManager.smtp_parallel(self.smtp_cfg), len(valid)))
+            head, tail = self._render_template(username)
+            use_asyncio = bool(self.smtp_cfg.get("use_asyncio", False))
+            if use_asyncio and aiosmtplib is None:
+                self._log("aiosmtplib is not installed; sending with smtplib instead.")
+            if valid and use_asyncio and aiosmtplib is not None:
+                asyncio.run(self._send_async(valid, head, tail, parallel))
+            elif valid:
+                self._send_threaded(valid, head, tail, parallel)
+            if self._stop.is_set():
+                self._log("Sending cancelled by user.")
         except Exception as e:
+            self._flush_log()
             self.error.emit(f"SMTP error: {e}")
         finally:
+            log_done.set()
+            self._flush_log()
             self.finished.emit()
 
 
@@ -238,56 +789,72 @@ class EmailListPage(QWidget):
         self.text.setStyleSheet("QTextEdit { padding: 10px; }")
         layout.addWidget(self.text)
 
+        self.lbl_preview = QLabel()
+        self.lbl_preview.setStyleSheet("color: gray;")
+        self.lbl_preview.hide()
+        layout.addWidget(self.lbl_preview)
+
+        # Full list of a large import; the editor only shows a preview of it
+        self._full_emails = None
+
         btns = QHBoxLayout()
         self.btn_load = QPushButton("Load from File (.txt/.csv)")
+        self.btn_clear = QPushButton("Clear List")
         self.btn_save = QPushButton("Save List")
         btns.addWidget(self.btn_load)
+        btns.addWidget(self.btn_clear)
         btns.addWidget(self.btn_save)
         layout.addLayout(btns)
 
         self.btn_load.clicked.connect(self.load_from_file)
+        self.btn_clear.clicked.connect(lambda: self.set_emails([]))
         self.btn_save.clicked.connect(self.save_list)
 
+        # Pending Save List write and how many recipients it holds
+        self._save_ticket = None
+        self._save_count = 0
+        ConfigManager.notifier().done.connect(self.on_saved)
+
     def set_emails(self, emails):
+        if len(emails) > EMAIL_PREVIEW_LIMIT:
+            self._full_emails = list(emails)
+            emails = emails[:EMAIL_PREVIEW_LIMIT]
+            self.lbl_preview.setText(
+                f"Showing the first {EMAIL_PREVIEW_LIMIT} of {len(self._full_emails)} emails. "
+                "Large lists are read-only here; save the list to keep all of them, "
+                "or use Clear List to start a new one by hand."
+            )
+            self.lbl_preview.show()
+        else:
+            self._full_emails = None
+            self.lbl_preview.hide()
         lines = [f"{i}. {e}" for i, e in enumerate(emails, start=1)]
         self.text.setPlainText("\n".join(lines))
+        self.text.setReadOnly(self._full_emails is not None)
 
     def get_emails(self):
+        if self._full_emails is not None:
+            return list(dict.fromkeys(self._full_emails))
         raw = self.text.toPlainText().splitlines()
         emails = []
         for line in raw:
-            line = line.strip()
-            if not line:
-                continue
-            if "." in line:
-                try:
-                    left, right = line.split(".", 1)
-                    if left.strip().isdigit():
-                        line = right.strip()
-                except ValueError:
-                    pass
-            emails.append(line)
-        uniq, seen = [], set()
-        for e in emails:
-            e2 = e.strip()
-            if e2 and e2 not in seen:
-                uniq.append(e2)
-                seen.add(e2)
-        return uniq
+            line = _NUM_PREFIX_RE.sub("", line.strip(), 1)
+            if line:
+                emails.append(line)
+        return list(dict.fromkeys(emails))
 
     def load_from_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open emails file", APP_DIR, "Text/CSV (*.txt *.csv)")
         if not path:
             return
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = [ln.strip() for ln in f if ln.strip()]
-            if len(lines) == 1 and "," in lines[0]:
-                parts = [p.strip() for p in lines[0].split(",") if p.strip()]
-            else:
-                parts = []
-                for ln in lines:
-                    parts.extend([p.strip() for p in ln.split(",") if p.strip()])
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raw = b""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        raw = mm[:].replace(b",", b"\n")
+            parts = [p.decode('utf-8') for p in map(bytes.strip, raw.split(b"\n")) if p]
             self.set_emails(parts)
             self.changed.emit()
         except Exception as e:
@@ -295,8 +862,17 @@ class EmailListPage(QWidget):
 
     def save_list(self):
         emails = self.get_emails()
-        ConfigManager.save_emails(emails)
-        QMessageBox.information(self, "Saved", f"Saved {len(emails)} recipients.")
+        self._save_count = len(emails)
+        self._save_ticket = ConfigManager.save_emails(emails)
+
+    def on_saved(self, ticket, path, error):
+        if ticket != self._save_ticket:
+            return
+        self._save_ticket = None
+        if error:
+            QMessageBox.warning(self, "Error", f"Failed to save list:\n{error}")
+            return
+        QMessageBox.information(self, "Saved", f"Saved {self._save_count} recipients.")
         self.changed.emit()
 
 
@@ -324,6 +900,8 @@ class SendMailPage(QWidget):
         att_group = QGroupBox("Attachments")
         att_layout = QVBoxLayout()
         self.att_list = QListWidget()
+        # Paths shown in att_list, kept in the same order as its rows
+        self._att_paths = []
         btns = QHBoxLayout()
         self.btn_add_att = QPushButton("Add Attachment")
         self.btn_del_att = QPushButton("Remove Selected")
@@ -354,6 +932,20 @@ class SendMailPage(QWidget):
 
         self.load_draft()
 
+        # Autosave the draft once typing pauses instead of on every keystroke
+        self._autosave = QTimer(self)
+        self._autosave.setSingleShot(True)
+        self._autosave.setInterval(500)
+        self._autosave.timeout.connect(self._write_draft)
+        self.subject.textChanged.connect(self._autosave.start)
+        self.body.textChanged.connect(self._autosave.start)
+
+        # Save Draft write awaiting confirmation; autosave failures are
+        # reported once until a save succeeds again
+        self._save_ticket = None
+        self._autosave_failed = False
+        ConfigManager.notifier().done.connect(self.on_saved)
+
         self.log = QTextEdit()
         self.log.setReadOnly(True)
         self.log.setPlaceholderText("Sending log will appear here...")
@@ -367,31 +959,59 @@ class SendMailPage(QWidget):
         self.subject.setText(draft.get("subject", ""))
         self.body.setPlainText(draft.get("body", ""))
         self.att_list.clear()
-        for p in draft.get("attachments", []):
-            if os.path.exists(p):
-                self.att_list.addItem(p)
+        self._att_paths = [p for p in draft.get("attachments", []) if os.path.exists(p)]
+        self.att_list.addItems(self._att_paths)
 
-    def save_draft(self):
+    def _write_draft(self):
         draft = {
             "subject": self.subject.text().strip(),
             "body": self.body.toPlainText(),
-            "attachments": [self.att_list.item(i).text() for i in range(self.att_list.count())]
+            "attachments": list(self._att_paths)
         }
-        ConfigManager.save_draft(draft)
-        QMessageBox.information(self, "Saved", "Draft saved.")
+        return ConfigManager.save_draft(draft)
+
+    def save_draft(self):
+        self._autosave.stop()
+        self._save_ticket = self._write_draft()
+
+    def flush_autosave(self):
+        if self._autosave.isActive():
+            self._autosave.stop()
+            self._write_draft()
+
+    def on_saved(self, ticket, path, error):
+        if path != DRAFT_PATH:
+            return
+        explicit = ticket == self._save_ticket
+        if explicit:
+            self._save_ticket = None
+        if error:
+            if explicit or not self._autosave_failed:
+                self._autosave_failed = True
+                QMessageBox.warning(self, "Error", f"Failed to save draft:\n{error}")
+            return
+        self._autosave_failed = False
+        if explicit:
+            QMessageBox.information(self, "Saved", "Draft saved.")
 
     def add_attachment(self):
         files, _ = QFileDialog.getOpenFileNames(self, "Select attachments", APP_DIR, "All Files (*.*)")
         for f in files:
             if f:
                 self.att_list.addItem(f)
+                self._att_paths.append(f)
+        self._autosave.start()
 
     def remove_attachment(self):
-        for item in self.att_list.selectedItems():
-            self.att_list.takeItem(self.att_list.row(item))
+        rows = sorted((self.att_list.row(item) for item in self.att_list.selectedItems()), reverse=True)
+        for row in rows:
+            self.att_list.takeItem(row)
+            del self._att_paths[row]
+        self._autosave.start()
 
     def append_log(self, text):
-        self.log.append(text)
+        self.log.moveCursor(QTextCursor.End)
+        self.log.insertPlainText(text + "\n")
 
     def clear_log(self):
         self.log.clear()
@@ -400,7 +1020,7 @@ class SendMailPage(QWidget):
         payload = {
             "subject": self.subject.text().strip(),
             "body": self.body.toPlainText(),
-            "attachments": [self.att_list.item(i).text() for i in range(self.att_list.count())]
+            "attachments": list(self._att_paths)
         }
         self.request_send.emit(payload)
 
@@ -425,6 +1045,14 @@ class SmtpConfigPage(QWidget):
         self.password.setEchoMode(QLineEdit.Password)
         self.use_tls = QCheckBox("Use STARTTLS")
         self.use_ssl = QCheckBox("Use SSL")
+        self.parallel = QSpinBox()
+        self.parallel.setRange(1, MAX_PARALLEL)
+        # The asyncio backend skips PIPELINING and the session pool, so it
+        # is opt-in rather than picked just because aiosmtplib is installed.
+        self.use_asyncio = QCheckBox("Send with aiosmtplib (asyncio)")
+        if aiosmtplib is None:
+            self.use_asyncio.setEnabled(False)
+            self.use_asyncio.setToolTip("pip install aiosmtplib to enable")
 
         form.addRow("SMTP Host:", self.host)
         form.addRow("SMTP Port:", self.port)
@@ -432,6 +1060,8 @@ class SmtpConfigPage(QWidget):
         form.addRow("Password:", self.password)
         form.addRow(self.use_tls)
         form.addRow(self.use_ssl)
+        form.addRow("Parallel Connections:", self.parallel)
+        form.addRow(self.use_asyncio)
 
         layout.addLayout(form)
 
@@ -450,6 +1080,10 @@ class SmtpConfigPage(QWidget):
         self.btn_save.clicked.connect(self.save_config)
         self.btn_test.clicked.connect(self.test_connection)
         self.btn_import.clicked.connect(self.import_config)
+
+        # Pending config writes -> (title, message) shown once they land
+        self._save_tickets = {}
+        ConfigManager.notifier().done.connect(self.on_saved)
         self.use_ssl.stateChanged.connect(self.on_ssl_changed)
 
     def on_ssl_changed(self):
@@ -465,6 +1099,8 @@ class SmtpConfigPage(QWidget):
         self.password.setText(cfg.get("password", ""))
         self.use_tls.setChecked(bool(cfg.get("use_tls", True)))
         self.use_ssl.setChecked(bool(cfg.get("use_ssl", False)))
+        self.parallel.setValue(ConfigManager.smtp_parallel(cfg))
+        self.use_asyncio.setChecked(bool(cfg.get("use_asyncio", False)))
 
     def save_config(self):
         cfg = {
@@ -473,11 +1109,12 @@ class SmtpConfigPage(QWidget):
             "username": self.username.text().strip(),
             "password": self.password.text(),
             "use_tls": self.use_tls.isChecked(),
-            "use_ssl": self.use_ssl.isChecked()
+            "use_ssl": self.use_ssl.isChecked(),
+            "parallel": int(self.parallel.value()),
+            "use_asyncio": self.use_asyncio.isChecked()
         }
-        ConfigManager.save_smtp(cfg)
-        QMessageBox.information(self, "Saved", "SMTP settings saved.")
-        self.changed.emit()
+        ticket = ConfigManager.save_smtp(cfg)
+        self._save_tickets[ticket] = ("Saved", "SMTP settings saved.")
 
     def import_config(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select SMTP config JSON", APP_DIR, "JSON (*.json)")
@@ -488,13 +1125,22 @@ class SmtpConfigPage(QWidget):
                 cfg = json.load(f)
             merged = ConfigManager.load_smtp()
             merged.update(cfg)
-            ConfigManager.save_smtp(merged)
-            self.load_config()
-            QMessageBox.information(self, "Imported", "SMTP configuration imported and saved.")
-            self.changed.emit()
+            ticket = ConfigManager.save_smtp(merged)
+            self._save_tickets[ticket] = ("Imported", "SMTP configuration imported and saved.")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to import config:\n{e}")
 
+    def on_saved(self, ticket, path, error):
+        if ticket not in self._save_tickets:
+            return
+        title, message = self._save_tickets.pop(ticket)
+        if error:
+            QMessageBox.warning(self, "Error", f"Failed to save SMTP settings:\n{error}")
+            return
+        self.load_config()
+        QMessageBox.information(self, title, message)
+        self.changed.emit()
+
     def test_connection(self):
         cfg = {
             "smtp_host": self.host.text().strip(),
@@ -507,9 +1153,9 @@ class SmtpConfigPage(QWidget):
         try:
             context = ssl.create_default_context()
             if cfg["use_ssl"]:
-                server = smtplib.SMTP_SSL(cfg["smtp_host"], cfg["smtp_port"], context=context)
+                server = smtplib.SMTP_SSL(cfg["smtp_host"], cfg["smtp_port"], context=context, timeout=SMTP_TIMEOUT)
             else:
-                server = smtplib.SMTP(cfg["smtp_host"], cfg["smtp_port"])
+                server = smtplib.SMTP(cfg["smtp_host"], cfg["smtp_port"], timeout=SMTP_TIMEOUT)
             with server:
                 server.ehlo()
                 if cfg["use_tls"] and not cfg["use_ssl"]:
@@ -604,8 +1250,12 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
 
         # ==== Data wiring ====
+        # Parsed emails.json / config.json, dropped when their page saves
+        self._emails_cache = None
+        self._smtp_cache = None
+
         self.refresh_recipients_count()
-        self.page_list.changed.connect(self.refresh_recipients_count)
+        self.page_list.changed.connect(self.on_list_changed)
         self.page_config.changed.connect(self.on_config_changed)
         self.page_send.request_send.connect(self.on_send_requested)
 
@@ -613,6 +1263,15 @@ class MainWindow(QMainWindow):
         self.thread = None
         self.worker = None
 
+        # SMTP sessions kept warm between campaigns
+        self._smtp_pool = SmtpPool()
+        self._keepalive = QTimer(self)
+        self._keepalive.setInterval(SMTP_KEEPALIVE_MS)
+        self._keepalive.timeout.connect(
+            lambda: QThreadPool.globalInstance().start(self._smtp_pool.keepalive)
+        )
+        self._keepalive.start()
+
         # Minimal theme
         self.setStyleSheet(
             "QMainWindow { background: white; }"
@@ -624,16 +1283,34 @@ class MainWindow(QMainWindow):
             "QPushButton:hover { background: #8C92AC; }"
         )
 
+    def _get_emails(self):
+        if self._emails_cache is None:
+            self._emails_cache = ConfigManager.load_emails().get("recipients", [])
+        return self._emails_cache
+
+    def _get_smtp(self):
+        if self._smtp_cache is None:
+            self._smtp_cache = ConfigManager.load_smtp()
+        return self._smtp_cache
+
     def refresh_recipients_count(self):
-        emails = ConfigManager.load_emails().get("recipients", [])
-        self.page_send.set_recipient_count(len(emails))
+        count = None
+        if self._emails_cache is None:
+            count = ConfigManager.load_email_count()
+        if count is None:
+            count = len(self._get_emails())
+        self.page_send.set_recipient_count(count)
+
+    def on_list_changed(self):
+        self._emails_cache = None
+        self.refresh_recipients_count()
 
     def on_config_changed(self):
-        # Reserved for future updates
-        pass
+        self._smtp_cache = None
+        QThreadPool.globalInstance().start(self._smtp_pool.close_all)
 
     def on_send_requested(self, payload):
-        emails = ConfigManager.load_emails().get("recipients", [])
+        emails = self._get_emails()
         if not emails:
             QMessageBox.warning(self, "No recipients", "Please add recipients in the Email List page.")
             return
@@ -642,7 +1319,7 @@ class MainWindow(QMainWindow):
                                     QMessageBox.Yes | QMessageBox.No) == QMessageBox.No:
                 return
 
-        smtp_cfg = ConfigManager.load_smtp()
+        smtp_cfg = self._get_smtp()
 
         self.page_send.clear_log()
         self.worker = SendWorker(
@@ -650,7 +1327,8 @@ class MainWindow(QMainWindow):
             recipients=emails,
             subject=payload.get("subject", ""),
             body=payload.get("body", ""),
-            attachments=payload.get("attachments", [])
+            attachments=payload.get("attachments", []),
+            pool=self._smtp_pool
         )
         self.thread = QThread()
         self.worker.moveToThread(self.thread)
@@ -668,12 +1346,21 @@ class MainWindow(QMainWindow):
         self.worker = None
         self.thread = None
 
+    def closeEvent(self, event):
+        self.page_send.flush_autosave()
+        self._keepalive.stop()
+        # Closing on the GUI thread must not wait on a QUIT per session
+        self._smtp_pool.close_all(quit=False)
+        super().closeEvent(event)
+
 # ---------------------------------- Entry ----------------------------------- #
 def main():
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
-    sys.exit(app.exec_())
+    code = app.exec_()
+    ConfigManager.flush()
+    sys.exit(code)
 
 
 if __name__ == "__main__":